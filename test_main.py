@@ -1,41 +1,91 @@
+import os
 import re
 import pytest
 from playwright.sync_api import Page, expect
 from datetime import datetime, timedelta
 
+#format of the server time and order history dates shown in the UI e.g. 2025-12-12 16:53:20
+SERVER_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+#compiled once for the live price checks - the price must contain digits before it is read
+PRICE_DIGITS_RE = re.compile(r'\d+')
+#a fully populated numeric input value e.g. 1.08523, checked before an input is read and parsed
+NUMERIC_VALUE_RE = re.compile(r'^\d+(\.\d+)?$')
+#order type labels of the pending order edit dialog and the server time clock, matched from the start of the text
+BUY_LIMIT_RE = re.compile(r"^BUY LIMIT$")
+BUY_STOP_RE = re.compile(r"^BUY STOP$")
+SERVER_TIME_RE = re.compile(r"^Server Time : ")
+
+#saved cookies and localStorage of a logged in session, reused by later runs until it is older than the max age
+AUTH_STATE_PATH = "auth.json"
+AUTH_STATE_MAX_AGE = timedelta(minutes=30)
+
+def login(page: Page):
+    """Log in through the UI and wait for the account name to show"""
+    page.goto("https://aqxtrader.aquariux.com")
+    # Fill in the login form.
+    page.get_by_test_id("login-user-id").fill("1000370")
+    page.get_by_test_id("login-password").fill("FE4Pi$q5Syj$")
+    
+    #the login button enables once the 2 form fields are filled, the click below waits for that
+    #wait on the login request itself instead of polling the page for the welcome announcement
+    with page.expect_response(lambda response: "login" in response.url.lower() and response.request.method == "POST") as login_response:
+        page.get_by_test_id("login-submit").click()
+    if not login_response.value.ok:
+        raise AssertionError(f"Login request failed: {login_response.value.status} {login_response.value.url}")
+    #the account name renders once the app has stored the session
+    expect(page.locator("text=Lay Jun Yi")).to_be_visible(timeout=5000)
+
+def auth_state_is_fresh():
+    """True if a saved login exists and is recent enough to reuse"""
+    if not os.path.exists(AUTH_STATE_PATH):
+        return False
+    return datetime.now() - datetime.fromtimestamp(os.path.getmtime(AUTH_STATE_PATH)) < AUTH_STATE_MAX_AGE
+
 @pytest.fixture(scope="session")
-def browser_context(playwright):
+def browser_context(playwright, request):
     """Session-scoped browser context that persists across tests"""
-    browser = playwright.chromium.launch(headless=False)
-    context = browser.new_context()
-
-    # Start tracing
-    context.tracing.start(screenshots=True, snapshots=True, sources=True)
+    # fail fast on quick UI checks, the known slow waits (login, order confirmation) pass their own timeout
+    expect.set_options(timeout=3000)
+
+    # run headless by default, set HEADED=1 to watch the browser
+    # the flags stop chromium from throttling timers and rendering when a headed window is in the background
+    # images are not needed by any check, skip loading them in the renderer - a context.route would turn off the http cache
+    browser = playwright.chromium.launch(headless=os.getenv("HEADED") != "1", args=[
+        "--blink-settings=imagesEnabled=false",
+        "--disable-background-timer-throttling",
+        "--disable-renderer-backgrounding",
+        "--disable-backgrounding-occluded-windows",
+    ])
+
+    # Perform the UI login only when there is no recent saved login, then start from the saved state
+    if not auth_state_is_fresh():
+        login_context = browser.new_context()
+        login(login_context.new_page())
+        login_context.storage_state(path=AUTH_STATE_PATH)
+        login_context.close()
+    context = browser.new_context(storage_state=AUTH_STATE_PATH)
+
+    # Start tracing - screenshots and snapshots are costly so only record them when TRACE=1 or pytest-playwright's --tracing is on
+    tracing_mode = "on" if os.getenv("TRACE") == "1" else request.config.getoption("--tracing", default="off")
+    tracing = tracing_mode != "off"
+    if tracing:
+        # retain-on-failure runs mostly pass and throw the trace away, so skip the screenshot stream there
+        context.tracing.start(screenshots=(tracing_mode == "on"), snapshots=True, sources=True)
 
     yield context
 
-    # Stop tracing and save
-    context.tracing.stop(path="trace.zip")
+    # Stop tracing and save, with --tracing retain-on-failure the trace is only kept when a test failed
+    if tracing:
+        keep_trace = tracing_mode == "on" or request.session.testsfailed > 0
+        context.tracing.stop(path="trace.zip" if keep_trace else None)
     context.close()
     browser.close()
 
 @pytest.fixture(scope="session")
 def authenticated_page(browser_context):
-    """Session-scoped page with login performed once"""
+    """Session-scoped page that is already logged in through the saved login state"""
     page = browser_context.new_page()
-    
-    # Perform login once
     page.goto("https://aqxtrader.aquariux.com")
-    # Fill in the login form.
-    page.get_by_test_id("login-user-id").fill("1000370")
-    page.get_by_test_id("login-password").fill("FE4Pi$q5Syj$")
-    
-    #expect the login button to be enabled once the 2 form fields are filled
-    expect(page.get_by_test_id("login-submit")).to_be_enabled()
-    page.get_by_test_id("login-submit").click()
-    # get span with id 0, the best i can do - wait up to 15 seconds for announcement after login
-    announcements = page.locator('[id="0"]')
-    expect(announcements).to_contain_text("Welcome to AQX Trader!", timeout=15000)
     #find the element with text Lay Jun Yi and confirm it is visible
     names = page.locator("text=Lay Jun Yi")
     expect(names).to_be_visible(timeout=10000)
@@ -57,73 +107,177 @@ def log_test_boundary(request):
     print(f"FINISHED TEST: {test_name}")
     print("="*80 + "\n")
 
-def test_demo_MarketOrder(authenticated_page: Page):
-    #get current buy prices - wait for element to have actual price content
-    price_element = authenticated_page.get_by_test_id("trade-live-buy-price")
+class TradePanel:
+    """Locators of the order panel and its confirmation dialog, built once per test - the assets edit dialogs reuse the same inputs"""
+    def __init__(self, page: Page):
+        self.page = page
+        self.buy_price = page.get_by_test_id("trade-live-buy-price")
+        self.order_type_dropdown = page.get_by_test_id("trade-dropdown-order-type")
+        self.price = page.locator('input[name="price"]')
+        self.stop_loss_price = page.get_by_test_id("trade-input-stoploss-price")
+        self.take_profit_price = page.get_by_test_id("trade-input-takeprofit-price")
+        self.stop_loss_points = page.get_by_test_id("trade-input-stoploss-points")
+        self.take_profit_points = page.get_by_test_id("trade-input-takeprofit-points")
+        self.volume = page.get_by_test_id("trade-input-volume")
+        self.expiry_dropdown = page.get_by_test_id("trade-dropdown-expiry")
+        self.expiry_date = page.get_by_test_id("trade-input-expiry-date")
+        self.expiry_time = page.get_by_test_id("trade-input-expiry-time")
+        self.order_button = page.get_by_test_id("trade-button-order")
+        self.confirmation_order_type = page.get_by_test_id("trade-confirmation-order-type")
+        self.confirm_button = page.get_by_test_id("trade-confirmation-button-confirm")
+
+    def read_buy_price(self) -> float:
+        """Wait for the live buy price to contain digits and parse it"""
+        # Wait for the price to actually contain numbers (not just be visible)
+        expect(self.buy_price).to_have_text(PRICE_DIGITS_RE, timeout=10000)
+        #remove any non-numeric characters and parse the price in the browser, a single round trip
+        currentPrice = self.buy_price.evaluate("el => parseFloat(el.textContent.replace(/[^0-9.]/g, ''))")
+        # Debug: print what we got
+        print(f"Current price: {currentPrice}")
+        return currentPrice
+
+    def fill_pending_order(self, order_type: str, price: float, volume: str = "0.1"):
+        """Pick the Limit or Stop order type and fill in its price and volume"""
+        # Click to open the dropdown (it's a custom div dropdown, not a native select)
+        self.order_type_dropdown.click()
+        # Click the option from the opened dropdown menu (using text only, avoiding auto-generated classes)
+        self.page.get_by_text(order_type, exact=True).click()
+        # Fill the price input field, it only shows once a pending order type is picked and fill() waits for that
+        self.price.fill(str(price))
+        # fill volume field - fill() focuses and replaces the existing value, no separate click/clear needed
+        self.volume.fill(volume)
+
+    def select_expiry(self, expiry: str):
+        """Pick the order expiry, the specified date ones are set to 7 days from now"""
+        #only open the dropdown when it shows another expiry - otherwise the current value and the option both match the text
+        #wait for the dropdown to render its current value before reading it once
+        expect(self.expiry_dropdown).not_to_have_text("")
+        if self.expiry_dropdown.text_content().strip() != expiry:
+            # Click to open the expiry dropdown (also a custom div dropdown)
+            self.expiry_dropdown.click()
+            self.page.get_by_text(expiry, exact=True).click()
+        if not expiry.startswith("Specified Date"):
+            return
+        future_date = datetime.now() + timedelta(days=7)
+        self.pick_expiry_date(future_date)
+        if expiry == "Specified Date and Time":
+            self.pick_expiry_time(future_date)
+
+    def pick_expiry_date(self, future_date: datetime):
+        """Pick the day of future_date in the react-calendar date picker"""
+        # Click to open the react-calendar date picker
+        self.expiry_date.click()
 
-    # Wait for the price to actually contain numbers (not just be visible)
-    expect(price_element).to_have_text(re.compile(r'\d+'), timeout=10000)
+        # Click the specific day using aria-label (format: "Month Day, Year")
+        # Example: "December 19, 2025"
+        target_aria_label = future_date.strftime("%B %d, %Y")  # "December 19, 2025"
+        print(f"Looking for calendar day with aria-label: {target_aria_label}")
 
-    currentPrice = price_element.text_content()
-    # Debug: print what we got
-    print(f"Raw price text: '{currentPrice}'")
+        # Find and click the button containing the abbr with the matching aria-label
+        # Clicking the abbr element will trigger the parent button, the click waits for the calendar to appear
+        day_button = self.page.locator(f'.react-calendar abbr[aria-label="{target_aria_label}"]')
+        day_button.click(timeout=5000)
 
-    currentPrice = float(re.sub(r'[^\d.]', '', currentPrice))  #remove any non-numeric characters
-    #prepare the price inputs as 5 % more and less than current price
-    stopLossPrice = currentPrice*0.95
-    takeProfitPrice = currentPrice*1.05
-    authenticated_page.get_by_test_id("trade-input-stoploss-price").fill(str(stopLossPrice))
-    authenticated_page.get_by_test_id("trade-input-takeprofit-price").fill(str(takeProfitPrice))
+    def pick_expiry_time(self, future_date: datetime):
+        """Pick the hour and minute of future_date in the time picker"""
+        target_hour = future_date.strftime("%H")  # 24-hour format with leading zero, e.g., "14"
+        target_minute = future_date.strftime("%M")  # Minutes with leading zero, e.g., "05"
 
-    #need to click on 2 different fields for the take profit points and volume points to auto-fill
-    authenticated_page.get_by_test_id("trade-input-takeprofit-points").click()
+        print(f"Setting time to: {target_hour}:{target_minute}")
 
-    # Clear and fill volume field
-    volume_input = authenticated_page.get_by_test_id("trade-input-volume")
-    volume_input.click()
-    volume_input.clear()
-    volume_input.fill("0.1")
+        # Click to open the time picker
+        self.expiry_time.click()
 
-    # add voume by 30 as min
-    #page.get_by_test_id("trade-input-stoploss-points").fill("30")
-    #page.get_by_test_id("trade-input-takeprofit-points").fill("30")
+        # Set Hour - click the Hour dropdown, the click auto-waits for the picker to render
+        hour_dropdown = self.page.locator('div:has-text("Hour") + div').first
+        hour_dropdown.click()
 
-    # Ensure the order button is enabled before clicking
-    order_button = authenticated_page.get_by_test_id("trade-button-order")
-    expect(order_button).to_be_enabled()
-    order_button.click()
+        # Click the target hour from the dropdown, the click waits for the options to appear
+        self.page.locator(f'[data-testid="options"] div:has-text("{target_hour}")').first.click(timeout=5000)
 
-    #expect trade confirmation dialog to appear - wait longer and check for the confirm button
-    expect(authenticated_page.get_by_test_id("trade-confirmation-button-confirm")).to_be_visible(timeout=10000)
+        # Set Minute - click the Minute dropdown
+        minute_dropdown = self.page.locator('div:has-text("Minute") + div').first
+        minute_dropdown.click()
 
-    # Verify confirmation dialog shows the correct order type
-    expect(authenticated_page.get_by_test_id("trade-confirmation-order-type")).to_have_text("BUY")
+        # Click the target minute from the dropdown, the click waits for the options to appear
+        self.page.locator(f'[data-testid="options"] div:has-text("{target_minute}")').first.click(timeout=5000)
 
-    # place a market order
-    authenticated_page.get_by_test_id("trade-confirmation-button-confirm").click()
+        # Click OK to confirm the time
+        self.page.get_by_role("button", name="OK").click()
 
-    expect(authenticated_page.get_by_text("Position has been created")).to_be_visible()
+    def submit_order(self, order_type: str, toast: str):
+        """Place the order, check the confirmation dialog shows the order type, confirm it and wait for the toast"""
+        #click() already waits for the order button to be enabled
+        self.order_button.click()
+        #to_have_text waits for the confirmation dialog to appear
+        expect(self.confirmation_order_type).to_have_text(order_type, timeout=10000)
+        self.confirm_button.click()
+        expect(self.page.get_by_text(toast)).to_be_visible(timeout=10000)
 
-def test_demo_editOpenPosition(authenticated_page: Page):
+@pytest.fixture
+def trade_panel(authenticated_page):
+    """Trade panel locators on the shared authenticated page"""
+    return TradePanel(authenticated_page)
+
+@pytest.fixture(scope="session")
+def current_buy_price(authenticated_page):
+    """Live buy price read once per session for the limit orders, which sit 10 % below it so a few minutes of drift does not matter"""
+    authenticated_page.goto("https://aqxtrader.aquariux.com/web/trade")
+    return TradePanel(authenticated_page).read_buy_price()
+
+def confirmation_value(page: Page, label: str):
+    """Value cell that follows the given label (e.g. "Stop Loss") in the order confirmation dialog"""
+    return page.get_by_test_id("trade-confirmation-label").filter(has_text=label).locator(
+        "xpath=following-sibling::*[@data-testid='trade-confirmation-value'][1]")
+
+def test_demo_MarketOrder(authenticated_page: Page, trade_panel: TradePanel):
+    #get current buy price once it has actual price content
+    currentPrice = trade_panel.read_buy_price()
+    #prepare the price inputs as 5 % more and less than current price
+    stopLossPrice = round(currentPrice*0.95, 5)
+    takeProfitPrice = round(currentPrice*1.05, 5)
+    trade_panel.stop_loss_price.fill(str(stopLossPrice))
+    trade_panel.take_profit_price.fill(str(takeProfitPrice))
+
+    #the points fields auto-fill when the price inputs lose focus, blur directly instead of clicking another field
+    trade_panel.take_profit_price.blur()
+
+    # fill volume field - fill() focuses and replaces the existing value, no separate click/clear needed
+    trade_panel.volume.fill("0.1")
+
+    # add voume by 30 as min
+    #page.get_by_test_id("trade-input-stoploss-points").fill("30")
+    #page.get_by_test_id("trade-input-takeprofit-points").fill("30")
+
+    #place the order and wait for the confirmation toast
+    trade_panel.submit_order("BUY", "Position has been created")
+
+def test_demo_editOpenPosition(authenticated_page: Page, trade_panel: TradePanel):
     # go to assets tab page
     authenticated_page.goto("https://aqxtrader.aquariux.com/web/assets")
     #click on Assets tab to see all orders
     #authenticated_page.get_by_test_id("side-bar-option-assets").click()
 
     #make sure both pending and open orders are present
-    expect(authenticated_page.get_by_test_id("tab-asset-order-type-open-positions")).to_be_visible()
+    authenticated_page.get_by_test_id("tab-asset-order-type-open-positions").wait_for(state="visible", timeout=5000)
 
     #retrieve the latest open position
     latestRow = authenticated_page.get_by_test_id("asset-open-list-item").last
     latestRow.get_by_test_id("asset-open-button-edit").click()
 
+    #the edit dialog reuses the trade panel inputs, only its update button is new
+    updateButton = authenticated_page.get_by_test_id("edit-button-order")
+
     #expect trade confirmation dialog to appear - wait longer and check for the confirm button
-    expect(authenticated_page.get_by_text("Edit Position")).to_be_visible(timeout=10000)
-    expect(authenticated_page.get_by_test_id("edit-button-order")).to_be_visible(timeout=10000)
+    authenticated_page.get_by_text("Edit Position").wait_for(state="visible", timeout=10000)
+    updateButton.wait_for(state="visible", timeout=10000)
     
-    # retrieve the stopLoss and takeProfit values
-    currentStoplossPrice = authenticated_page.get_by_test_id("trade-input-stoploss-price").input_value()
-    currentTakeprofitPrice = authenticated_page.get_by_test_id("trade-input-takeprofit-price").input_value()
+    # retrieve the stopLoss and takeProfit values once the dialog has filled them in
+    expect(trade_panel.stop_loss_price).to_have_value(NUMERIC_VALUE_RE)
+    expect(trade_panel.take_profit_price).to_have_value(NUMERIC_VALUE_RE)
+    #read both inputs in a single round trip
+    currentStoplossPrice, currentTakeprofitPrice = authenticated_page.evaluate(
+        """() => ['trade-input-stoploss-price', 'trade-input-takeprofit-price'].map(id => document.querySelector(`[data-testid="${id}"]`).value)""")
     #for Debug purposes
     print(f"Current Stoploss Price: {currentStoplossPrice}  Current Takeprofit Price: {currentTakeprofitPrice}")
 
@@ -131,37 +285,27 @@ def test_demo_editOpenPosition(authenticated_page: Page):
     newStoplossPrice = round(float(currentStoplossPrice)*0.95, 5)
     newTakeprofitPrice = round(float(currentTakeprofitPrice)*1.05, 5)
     print(f"New Stoploss Price: {newStoplossPrice}  New Takeprofit Price: {newTakeprofitPrice}")
-    authenticated_page.get_by_test_id("trade-input-stoploss-price").fill(str(newStoplossPrice))
-    authenticated_page.get_by_test_id("trade-input-stoploss-points").click()  #click on separate field to activate auto-update
-    expect(authenticated_page.get_by_test_id("trade-input-stoploss-price")).to_have_value(str(newStoplossPrice))
-    authenticated_page.get_by_test_id("trade-input-takeprofit-price").fill(str(newTakeprofitPrice))
-    authenticated_page.get_by_test_id("trade-input-stoploss-points").click()  #click on separate field to activate auto-update
-    expect(authenticated_page.get_by_test_id("trade-input-takeprofit-price")).to_have_value(str(newTakeprofitPrice))
-
-    authenticated_page.get_by_test_id("trade-input-stoploss-points").click()
-    authenticated_page.get_by_test_id("trade-input-takeprofit-points").click()
-    expect(authenticated_page.get_by_test_id("trade-input-stoploss-points")).not_to_be_empty(timeout=5000)
-    expect(authenticated_page.get_by_test_id("trade-input-takeprofit-points")).not_to_be_empty(timeout=5000)
-    #click on separate field to activate auto-update
-    authenticated_page.get_by_test_id("trade-input-takeprofit-points").click()
+    trade_panel.stop_loss_price.fill(str(newStoplossPrice))
+    trade_panel.take_profit_price.fill(str(newTakeprofitPrice))
+    #the points fields auto-update when a price input loses focus - filling take profit blurs stop loss, then blur take profit directly
+    trade_panel.take_profit_price.blur()
+    expect(trade_panel.stop_loss_price).to_have_value(str(newStoplossPrice))
+    expect(trade_panel.take_profit_price).to_have_value(str(newTakeprofitPrice))
+    expect(trade_panel.stop_loss_points).not_to_be_empty(timeout=5000)
+    expect(trade_panel.take_profit_points).not_to_be_empty(timeout=5000)
     # click on update position button
-    authenticated_page.get_by_test_id("edit-button-order").click()
+    updateButton.click()
 
-    #expect order confirmation dialog to appear
-    expect(authenticated_page.get_by_text("Order Confirmation")).to_be_visible(timeout=10000)
-    expect(authenticated_page.get_by_test_id("trade-confirmation-button-confirm")).to_be_visible(timeout=10000)
-
-    #Verify correct order type
-    expect(authenticated_page.get_by_test_id("trade-confirmation-order-type")).to_have_text("BUY")
+    #expect order confirmation dialog with the correct order type - to_have_text waits for the dialog to appear
+    expect(trade_panel.confirmation_order_type).to_have_text("BUY", timeout=10000)
     # verify the stopLoss and takeprofit price changes
-    # Target the parent div that contains both label and value, then get the value sibling
     # basically 1 parent -> 1st div(label):text with stop loss, 2nd div(value):text
-    stop_loss_value = authenticated_page.locator('div[data-testid="trade-confirmation-label"]:has-text("Stop Loss") + div[data-testid="trade-confirmation-value"]')
-    take_profit_value = authenticated_page.locator('div[data-testid="trade-confirmation-label"]:has-text("Take Profit") + div[data-testid="trade-confirmation-value"]')
+    stop_loss_value = confirmation_value(authenticated_page, "Stop Loss")
+    take_profit_value = confirmation_value(authenticated_page, "Take Profit")
 
     # Wait for elements to be visible
-    expect(stop_loss_value).to_be_visible()
-    expect(take_profit_value).to_be_visible()
+    stop_loss_value.wait_for(state="visible", timeout=5000)
+    take_profit_value.wait_for(state="visible", timeout=5000)
 
     tradeStopLossPrice = stop_loss_value.text_content()
     tradeTakeProfitPrice = take_profit_value.text_content()
@@ -173,7 +317,7 @@ def test_demo_editOpenPosition(authenticated_page: Page):
         raise AssertionError(f"Take Profit price mismatch: expected {newTakeprofitPrice}, got {tradeTakeProfitPrice}")
     
     #click confirm button
-    authenticated_page.get_by_test_id("trade-confirmation-button-confirm").click()
+    trade_panel.confirm_button.click()
 
     #expect toast notification
     expect(authenticated_page.get_by_text("Position has been updated.")).to_be_visible()
@@ -185,55 +329,55 @@ def test_demo_partialCloseOpenPosition(authenticated_page: Page):
     #authenticated_page.get_by_test_id("side-bar-option-assets").click()
 
     #make sure both pending and open orders are present
-    expect(authenticated_page.get_by_test_id("tab-asset-order-type-open-positions")).to_be_visible()
+    authenticated_page.get_by_test_id("tab-asset-order-type-open-positions").wait_for(state="visible", timeout=5000)
+
+    #locators reused throughout the close flow, built once
+    open_positions = authenticated_page.get_by_test_id("asset-open-list-item")
+    confirmButton = authenticated_page.get_by_role("button", name="Confirm")
+    #the value cell next to the "Order No." label inside the close dialog
+    orderNumberValue = authenticated_page.locator('div[id="overlay-aqx-trader"]').locator('div:has(div:text("Order No.")) + div').first
+    volumeInput = authenticated_page.get_by_placeholder("Min: 0.01")
 
     #retrieve the latest open position
-    latestRow = authenticated_page.get_by_test_id("asset-open-list-item").last
+    latestRow = open_positions.last
     # click on the close button
     latestRow.get_by_test_id("asset-open-button-close").click()
 
-    #expect Close confirmation dialog to appear - wait longer and check for the confirm button
-    expect(authenticated_page.get_by_text("Confirm To Close Position")).to_be_visible(timeout=10000)
-    expect(authenticated_page.get_by_role("button").get_by_text("Confirm")).to_be_visible(timeout=10000)
+    #expect Close confirmation dialog to appear - the confirm button renders after the title, so waiting on it covers both
+    confirmButton.wait_for(state="visible", timeout=10000)
 
     #retrieve order number to confirm if full close later
-    overlay = authenticated_page.locator('div[id="overlay-aqx-trader"]')
-    orderNumberList = overlay.locator('div:has-text("Order No.") + div').first
+    orderNumber = orderNumberValue.text_content()
     #To Debug
-    orderNumber = orderNumberList.text_content()
     print(f"Order Number Element Text : '{orderNumber}'")
-    #retrieve current volume
-    currentVolume = authenticated_page.get_by_placeholder("Min: 0.01").input_value()
+    #retrieve current volume once the dialog has filled it in
+    expect(volumeInput).to_have_value(NUMERIC_VALUE_RE)
+    currentVolume = volumeInput.input_value()
     print(f"Current Volume: {currentVolume}")
     #calculate half volume
     halfVolume = round(float(currentVolume)/2, 5)
     print(f"Half Volume: {halfVolume}")
     # fill in half volume
-    volume_input = authenticated_page.get_by_placeholder("Min: 0.01").fill(str(halfVolume))
+    volumeInput.fill(str(halfVolume))
     # click on confirm Close position button
-    authenticated_page.get_by_role("button").get_by_text("Confirm").click()
+    confirmButton.click()
     #expect toast notification
     expect(authenticated_page.get_by_text("Position has been closed.")).to_be_visible()
 
-    #wait for the open positions list to refresh
-    authenticated_page.wait_for_timeout(4000)
+    #the list refreshes as the toast goes away, wait for that instead of a fixed sleep
+    expect(authenticated_page.get_by_text("Position has been closed.")).to_be_hidden(timeout=5000)
     #verfiy that the order number is still in the open positions list
-    open_positions = authenticated_page.get_by_test_id("asset-open-list-item").all()
-    found = False
-    for pos in open_positions:
-        pos_text = pos.get_by_test_id("asset-open-column-order-id").text_content()
-        print(f"Checking open position Order ID: '{pos_text}' against '{orderNumber}'")
-        if orderNumber in pos_text:
-            print(f"Order Number {orderNumber} still found in open positions after partial close, as expected.")
-            pos.get_by_test_id("asset-open-button-close").click()
-            #check the remaing volume is equal to halfVolume
-            remainingVolume = authenticated_page.get_by_placeholder("Min: 0.01").input_value()
-            found = True
-            if float(remainingVolume) != halfVolume:
-                raise AssertionError(f"Remaining volume mismatch: expected {halfVolume}, got {remainingVolume}")
-            break
-    if not found:
-        raise AssertionError(f"Order Number {orderNumber} not found in open positions after partial close.")
+    #let the browser match the row instead of pulling every order id back to python
+    matchedRow = open_positions.filter(
+        has=authenticated_page.get_by_test_id("asset-open-column-order-id").filter(has_text=orderNumber))
+    expect(matchedRow).to_have_count(1)
+    matchedRow.get_by_test_id("asset-open-button-close").click()
+    #check the remaing volume is equal to halfVolume - wait for the refreshed volume to replace the old one first
+    expect(volumeInput).not_to_have_value(currentVolume, timeout=5000)
+    expect(volumeInput).to_have_value(NUMERIC_VALUE_RE)
+    remainingVolume = volumeInput.input_value()
+    if float(remainingVolume) != halfVolume:
+        raise AssertionError(f"Remaining volume mismatch: expected {halfVolume}, got {remainingVolume}")
     
             
 def test_demo_fullCloseOpenPosition(authenticated_page: Page):
@@ -243,699 +387,172 @@ def test_demo_fullCloseOpenPosition(authenticated_page: Page):
     # authenticated_page.get_by_test_id("side-bar-option-assets").click()
 
     #make sure both pending and open orders are present
-    expect(authenticated_page.get_by_test_id("tab-asset-order-type-open-positions")).to_be_visible()
+    authenticated_page.get_by_test_id("tab-asset-order-type-open-positions").wait_for(state="visible", timeout=5000)
+
+    #locators reused throughout the close flow, built once
+    open_positions = authenticated_page.get_by_test_id("asset-open-list-item")
+    confirmButton = authenticated_page.get_by_role("button", name="Confirm")
+    #the value cell next to the "Order No." label inside the close dialog
+    orderNumberValue = authenticated_page.locator('div[id="overlay-aqx-trader"]').locator('div:has(div:text("Order No.")) + div').first
 
     #retrieve the latest open position
-    latestRow = authenticated_page.get_by_test_id("asset-open-list-item").last
+    latestRow = open_positions.last
     # click on the close button
     latestRow.get_by_test_id("asset-open-button-close").click()
 
-    #expect Close confirmation dialog to appear - wait longer and check for the confirm button
-    expect(authenticated_page.get_by_text("Confirm To Close Position")).to_be_visible(timeout=10000)
-    expect(authenticated_page.get_by_role("button").get_by_text("Confirm")).to_be_visible(timeout=10000)
+    #expect Close confirmation dialog to appear - the confirm button renders after the title, so waiting on it covers both
+    confirmButton.wait_for(state="visible", timeout=10000)
 
     #retrieve order number to confirm if full close later
-    orderNumberList = authenticated_page.locator('div:has(div:text("Order No.")) + div').all()
+    orderNumber = orderNumberValue.text_content()
     #To Debug
-    for i, val in enumerate(orderNumberList):
-        print(f"Order Number Element Text[{i}]: '{val.text_content()}'")
-    orderNumber = orderNumberList[0].text_content()
+    print(f"Order Number Element Text : '{orderNumber}'")
 
     #max button to get full volume
     authenticated_page.get_by_test_id("close-order-input-volume-static-max").click()
     # click on confirm Close position button
-    authenticated_page.get_by_role("button").get_by_text("Confirm").click()
+    confirmButton.click()
     #expect toast notification
     expect(authenticated_page.get_by_text("Position has been closed.")).to_be_visible()
     #verfiy that the order number is no longer in the open positions list
-    open_positions = authenticated_page.get_by_test_id("asset-open-list-item").all()
-    for pos in open_positions:
-        pos_text = pos.get_by_test_id("asset-open-column-order-id").text_content()
-        if orderNumber in pos_text:
-            raise AssertionError(f"Order Number {orderNumber} still found in open positions after closing.")
+    #let the browser match the row instead of pulling every order id back to python
+    closedRow = open_positions.filter(
+        has=authenticated_page.get_by_test_id("asset-open-column-order-id").filter(has_text=orderNumber))
+    expect(closedRow).to_have_count(0)
 
 #the Limit Buy Order with Good Till Canceled expiry is pending order to buy when prices reach below stated price
-def test_demo_createLimitGoodTillCanceled(authenticated_page: Page):
+def test_demo_createLimitGoodTillCanceled(authenticated_page: Page, trade_panel: TradePanel, current_buy_price: float):
     authenticated_page.goto("https://aqxtrader.aquariux.com/web/trade")
 
-    #get current buy prices - wait for element to have actual price content
-    price_element = authenticated_page.get_by_test_id("trade-live-buy-price")
-
-    # Wait for the price to actually contain numbers (not just be visible)
-    expect(price_element).to_have_text(re.compile(r'\d+'), timeout=10000)
-
-    currentPrice = price_element.text_content()
-    # Debug: print what we got
-    print(f"Raw price text: '{currentPrice}'")
-
-    currentPrice = float(re.sub(r'[^\d.]', '', currentPrice))  #remove any non-numeric characters
     #Make the buyLowPrice 10% less than current price.
-    buyLowPrice = currentPrice*0.90
+    buyLowPrice = round(current_buy_price*0.90, 5)
 
     #create a pending order now with the new price
-    # Click to open the dropdown (it's a custom div dropdown, not a native select)
-    authenticated_page.get_by_test_id("trade-dropdown-order-type").click()
-
-    # Click the "Limit" option from the opened dropdown menu (using text only, avoiding auto-generated classes)
-    authenticated_page.get_by_text("Limit", exact=True).click()
+    trade_panel.fill_pending_order("Limit", buyLowPrice)
 
-    # Fill the price input field (name attribute is "price")
-    price_input = authenticated_page.locator('input[name="price"]')
-    expect(price_input).to_be_visible()
-    price_input.fill(str(buyLowPrice))
-    
-    # Clear and fill volume field
-    volume_input = authenticated_page.get_by_test_id("trade-input-volume")
-    volume_input.click()
-    volume_input.clear()
-    volume_input.fill("0.1")
-
-    # ensure order expiry is set to Good Till Canceled
-    # Click to open the expiry dropdown (also a custom div dropdown)
-    authenticated_page.get_by_test_id("trade-dropdown-expiry").click()
-
-    # Click the "Good Till Canceled" option (note that this option is in a separate div element)
-    #the second element has to be selected.
-    authenticated_page.get_by_text("Good Till Canceled", exact=True).all()[1].click()
-    # Ensure the order button is enabled before clicking
-    order_button = authenticated_page.get_by_test_id("trade-button-order")
-    expect(order_button).to_be_enabled()
-    order_button.click()
+    # set the order expiry
+    trade_panel.select_expiry("Good Till Canceled")
 
-    #expect trade confirmation dialog to appear - wait longer and check for the confirm button
-    expect(authenticated_page.get_by_test_id("trade-confirmation-button-confirm")).to_be_visible(timeout=10000)
-    # Verify confirmation dialog shows the correct order type
-    expect(authenticated_page.get_by_test_id("trade-confirmation-order-type")).to_have_text("BUY LIMIT")
-
-    #click on confirm button
-    authenticated_page.get_by_test_id("trade-confirmation-button-confirm").click()
-    #confirm toast notification
-    expect(authenticated_page.get_by_text("Order has been created.")).to_be_visible(timeout=10000)
+    #place the order and wait for the confirmation toast
+    trade_panel.submit_order("BUY LIMIT", "Order has been created.")
 
 #the Limit Buy Order with Good Till Day expiry is pending order to buy when prices reach below stated price 
 # until day ends 
-def test_demo_createLimitGoodTillDay(authenticated_page: Page):
+def test_demo_createLimitGoodTillDay(authenticated_page: Page, trade_panel: TradePanel, current_buy_price: float):
     authenticated_page.goto("https://aqxtrader.aquariux.com/web/trade")
 
-    #get current buy prices - wait for element to have actual price content
-    price_element = authenticated_page.get_by_test_id("trade-live-buy-price")
-
-    # Wait for the price to actually contain numbers (not just be visible)
-    expect(price_element).to_have_text(re.compile(r'\d+'), timeout=10000)
-
-    currentPrice = price_element.text_content()
-    # Debug: print what we got
-    print(f"Raw price text: '{currentPrice}'")
-
-    currentPrice = float(re.sub(r'[^\d.]', '', currentPrice))  #remove any non-numeric characters
     #Make the buyLowPrice 10 % less than current price.
-    buyLowPrice = currentPrice*0.90
+    buyLowPrice = round(current_buy_price*0.90, 5)
 
     #create a pending order now with the new price
-    # Click to open the dropdown (it's a custom div dropdown, not a native select)
-    authenticated_page.get_by_test_id("trade-dropdown-order-type").click()
-
-    # Click the "Limit" option from the opened dropdown menu (using text only, avoiding auto-generated classes)
-    authenticated_page.get_by_text("Limit", exact=True).click()
-
-    # Fill the price input field (name attribute is "price")
-    price_input = authenticated_page.locator('input[name="price"]')
-    expect(price_input).to_be_visible()
-    price_input.fill(str(buyLowPrice))
-    
-    # Clear and fill volume field
-    volume_input = authenticated_page.get_by_test_id("trade-input-volume")
-    volume_input.click()
-    volume_input.clear()
-    volume_input.fill("0.1")
+    trade_panel.fill_pending_order("Limit", buyLowPrice)
 
-    # ensure order expiry is set to Good Till Day
-    # Click to open the expiry dropdown (also a custom div dropdown)
-    authenticated_page.get_by_test_id("trade-dropdown-expiry").click()
-
-    # Click the "Good Till Day" option, note that default is Good Til Canceled and so no need for [1]. but note in future.
-    authenticated_page.get_by_text("Good Till Day", exact=True).click()
-
-    # Ensure the order button is enabled before clicking
-    order_button = authenticated_page.get_by_test_id("trade-button-order")
-    expect(order_button).to_be_enabled()
-    order_button.click()
-
-    #expect trade confirmation dialog to appear - wait longer and check for the confirm button
-    expect(authenticated_page.get_by_test_id("trade-confirmation-button-confirm")).to_be_visible(timeout=10000)
-    # Verify confirmation dialog shows the correct order type
-    expect(authenticated_page.get_by_test_id("trade-confirmation-order-type")).to_have_text("BUY LIMIT")
+    # set the order expiry
+    trade_panel.select_expiry("Good Till Day")
 
-    #click on confirm button
-    authenticated_page.get_by_test_id("trade-confirmation-button-confirm").click()
-    #confirm toast notification
-    expect(authenticated_page.get_by_text("Order has been created.")).to_be_visible(timeout=10000)
+    #place the order and wait for the confirmation toast
+    trade_panel.submit_order("BUY LIMIT", "Order has been created.")
 
 #the Limit Buy Order with Good Till Date expiry is pending order to buy when prices reach below stated price 
 # until the spcified date
-def test_demo_createLimitGoodTillDate(authenticated_page: Page):
+def test_demo_createLimitGoodTillDate(authenticated_page: Page, trade_panel: TradePanel, current_buy_price: float):
     authenticated_page.goto("https://aqxtrader.aquariux.com/web/trade")
 
-    #get current buy prices - wait for element to have actual price content
-    price_element = authenticated_page.get_by_test_id("trade-live-buy-price")
-
-    # Wait for the price to actually contain numbers (not just be visible)
-    expect(price_element).to_have_text(re.compile(r'\d+'), timeout=10000)
-
-    currentPrice = price_element.text_content()
-    # Debug: print what we got
-    print(f"Raw price text: '{currentPrice}'")
-
-    currentPrice = float(re.sub(r'[^\d.]', '', currentPrice))  #remove any non-numeric characters
     #Make the buyLowPrice 10 % less than current price.
-    buyLowPrice = currentPrice*0.90
+    buyLowPrice = round(current_buy_price*0.90, 5)
 
     #create a pending order now with the new price
-    # Click to open the dropdown (it's a custom div dropdown, not a native select)
-    authenticated_page.get_by_test_id("trade-dropdown-order-type").click()
-
-    # Click the "Limit" option from the opened dropdown menu (using text only, avoiding auto-generated classes)
-    authenticated_page.get_by_text("Limit", exact=True).click()
-
-    # Fill the price input field (name attribute is "price")
-    price_input = authenticated_page.locator('input[name="price"]')
-    expect(price_input).to_be_visible()
-    price_input.fill(str(buyLowPrice))
-    
-    # Clear and fill volume field
-    volume_input = authenticated_page.get_by_test_id("trade-input-volume")
-    volume_input.click()
-    volume_input.clear()
-    volume_input.fill("0.1")
-
-    # ensure order expiry is set to Good Till Day
-    # Click to open the expiry dropdown (also a custom div dropdown)
-    authenticated_page.get_by_test_id("trade-dropdown-expiry").click()
+    trade_panel.fill_pending_order("Limit", buyLowPrice)
 
-    # Click the "Good Till Day" option, note that default is Good Til Canceled and so no need for [1]. but note in future.
-    authenticated_page.get_by_text("Specified Date", exact=True).click()
+    # set the order expiry
+    trade_panel.select_expiry("Specified Date")
 
-    # Calculate target date (7 days from now)
-    future_date = datetime.now() + timedelta(days=7)
-    print(f"Setting expiry date to: {future_date.strftime('%Y-%m-%d')}")
-
-    # Click to open the react-calendar date picker
-    authenticated_page.get_by_test_id("trade-input-expiry-date").click()
-
-    # Wait for the calendar to appear
-    authenticated_page.wait_for_selector('.react-calendar', timeout=5000)
-
-    # Click the specific day using aria-label (format: "Month Day, Year")
-    # Example: "December 19, 2025"
-    target_aria_label = future_date.strftime("%B %d, %Y")  # "December 19, 2025"
-    print(f"Looking for calendar day with aria-label: {target_aria_label}")
-
-    # Find and click the button containing the abbr with the matching aria-label
-    # Clicking the abbr element will trigger the parent button
-    day_button = authenticated_page.locator(f'.react-calendar abbr[aria-label="{target_aria_label}"]')
-    day_button.click()
-    # Ensure the order button is enabled before clicking
-    order_button = authenticated_page.get_by_test_id("trade-button-order")
-    expect(order_button).to_be_enabled()
-    order_button.click()
-
-    #expect trade confirmation dialog to appear - wait longer and check for the confirm button
-    expect(authenticated_page.get_by_test_id("trade-confirmation-button-confirm")).to_be_visible(timeout=10000)
-    # Verify confirmation dialog shows the correct order type
-    expect(authenticated_page.get_by_test_id("trade-confirmation-order-type")).to_have_text("BUY LIMIT")
-
-    #click on confirm button
-    authenticated_page.get_by_test_id("trade-confirmation-button-confirm").click()
-    #confirm toast notification
-    expect(authenticated_page.get_by_text("Order has been created.")).to_be_visible(timeout=10000)
+    #place the order and wait for the confirmation toast
+    trade_panel.submit_order("BUY LIMIT", "Order has been created.")
 
 #the Limit Buy Order with Good Till Date expiry is pending order to buy when prices reach below stated price 
 # until the spcified date
-def test_demo_createLimitGoodTillDateAndTime(authenticated_page: Page):
+def test_demo_createLimitGoodTillDateAndTime(authenticated_page: Page, trade_panel: TradePanel, current_buy_price: float):
     authenticated_page.goto("https://aqxtrader.aquariux.com/web/trade")
 
-    #get current buy prices - wait for element to have actual price content
-    price_element = authenticated_page.get_by_test_id("trade-live-buy-price")
-
-    # Wait for the price to actually contain numbers (not just be visible)
-    expect(price_element).to_have_text(re.compile(r'\d+'), timeout=10000)
-
-    currentPrice = price_element.text_content()
-    # Debug: print what we got
-    print(f"Raw price text: '{currentPrice}'")
-
-    currentPrice = float(re.sub(r'[^\d.]', '', currentPrice))  #remove any non-numeric characters
     #Make the buyLowPrice 10 % less than current price.
-    buyLowPrice = currentPrice*0.90
+    buyLowPrice = round(current_buy_price*0.90, 5)
 
     #create a pending order now with the new price
-    # Click to open the dropdown (it's a custom div dropdown, not a native select)
-    authenticated_page.get_by_test_id("trade-dropdown-order-type").click()
-
-    # Click the "Limit" option from the opened dropdown menu (using text only, avoiding auto-generated classes)
-    authenticated_page.get_by_text("Limit", exact=True).click()
-
-    # Fill the price input field (name attribute is "price")
-    price_input = authenticated_page.locator('input[name="price"]')
-    expect(price_input).to_be_visible()
-    price_input.fill(str(buyLowPrice))
-    
-    # Clear and fill volume field
-    volume_input = authenticated_page.get_by_test_id("trade-input-volume")
-    volume_input.click()
-    volume_input.clear()
-    volume_input.fill("0.1")
-
-    # ensure order expiry is set to Good Till Day
-    # Click to open the expiry dropdown (also a custom div dropdown)
-    authenticated_page.get_by_test_id("trade-dropdown-expiry").click()
+    trade_panel.fill_pending_order("Limit", buyLowPrice)
 
-    # Click the "Good Till Day" option, note that default is Good Til Canceled and so no need for [1]. but note in future.
-    authenticated_page.get_by_text("Specified Date and Time", exact=True).click()
+    # set the order expiry
+    trade_panel.select_expiry("Specified Date and Time")
 
-    # Calculate target date (7 days from now)
-    future_date = datetime.now() + timedelta(days=7)
-    print(f"Setting expiry date & time to: {future_date.strftime('%Y-%m-%d %H:%M')}")
-
-    # Click to open the react-calendar date picker
-    authenticated_page.get_by_test_id("trade-input-expiry-date").click()
-
-    # Wait for the calendar to appear
-    authenticated_page.wait_for_selector('.react-calendar', timeout=5000)
-
-    # Click the specific day using aria-label (format: "Month Day, Year")
-    # Example: "December 19, 2025"
-    target_aria_label = future_date.strftime("%B %d, %Y")  # "December 19, 2025"
-    print(f"Looking for calendar day with aria-label: {target_aria_label}")
-
-    # Find and click the button containing the abbr with the matching aria-label
-    # Clicking the abbr element will trigger the parent button
-    day_button = authenticated_page.locator(f'.react-calendar abbr[aria-label="{target_aria_label}"]')
-    day_button.click()
-
-    # Set the time picker
-    target_hour = future_date.strftime("%H")  # 24-hour format with leading zero, e.g., "14"
-    target_minute = future_date.strftime("%M")  # Minutes with leading zero, e.g., "05"
-
-    print(f"Setting time to: {target_hour}:{target_minute}")
-
-    # Click to open the time picker
-    authenticated_page.get_by_test_id("trade-input-expiry-time").click()
-    authenticated_page.wait_for_timeout(500)  # Wait for picker to render
-
-    # Set Hour - click the Hour dropdown
-    hour_dropdown = authenticated_page.locator('div:has-text("Hour") + div').first
-    hour_dropdown.click()
-
-    # Wait for the dropdown options to appear
-    authenticated_page.wait_for_selector('[data-testid="options"]', timeout=5000)
-
-    # Click the target hour from the dropdown
-    authenticated_page.locator(f'[data-testid="options"] div:has-text("{target_hour}")').first.click()
-
-    # Set Minute - click the Minute dropdown
-    minute_dropdown = authenticated_page.locator('div:has-text("Minute") + div').first
-    minute_dropdown.click()
-
-    # Wait for the dropdown options to appear
-    authenticated_page.wait_for_selector('[data-testid="options"]', timeout=5000)
-
-    # Click the target minute from the dropdown
-    authenticated_page.locator(f'[data-testid="options"] div:has-text("{target_minute}")').first.click()
-
-    # Click OK to confirm the time
-    authenticated_page.get_by_role("button", name="OK").click()
+    #place the order and wait for the confirmation toast
+    trade_panel.submit_order("BUY LIMIT", "Order has been created.")
 
-    # Ensure the order button is enabled before clicking
-    order_button = authenticated_page.get_by_test_id("trade-button-order")
-    expect(order_button).to_be_enabled()
-    order_button.click()
-
-    #expect trade confirmation dialog to appear - wait longer and check for the confirm button
-    expect(authenticated_page.get_by_test_id("trade-confirmation-button-confirm")).to_be_visible(timeout=10000)
-    # Verify confirmation dialog shows the correct order type
-    expect(authenticated_page.get_by_test_id("trade-confirmation-order-type")).to_have_text("BUY LIMIT")
-
-    #click on confirm button
-    authenticated_page.get_by_test_id("trade-confirmation-button-confirm").click()
-    #confirm toast notification
-    expect(authenticated_page.get_by_text("Order has been created.")).to_be_visible(timeout=10000)
-
-#the Stop Buy Order with Good Till Canceled expiry is pending order to buy when prices reach above stated price
-#to buy on a breakout
-def test_demo_createStopGoodTillCanceled(authenticated_page: Page):
+#the Stop Buy Orders are pending orders to buy when prices reach above stated price, to buy on a breakout / buying momentum
+#one order is created for each type of expiry
+@pytest.mark.parametrize("expiry", ["Good Till Canceled", "Good Till Day", "Specified Date", "Specified Date and Time"],
+                         ids=["GoodTillCanceled", "GoodTillDay", "GoodTillDate", "GoodTillDateAndTime"])
+def test_demo_createStop(authenticated_page: Page, trade_panel: TradePanel, expiry: str):
     authenticated_page.goto("https://aqxtrader.aquariux.com/web/trade")
 
-    #get current buy prices - wait for element to have actual price content
-    price_element = authenticated_page.get_by_test_id("trade-live-buy-price")
-
-    # Wait for the price to actually contain numbers (not just be visible)
-    expect(price_element).to_have_text(re.compile(r'\d+'), timeout=10000)
-
-    currentPrice = price_element.text_content()
-    # Debug: print what we got
-    print(f"Raw price text: '{currentPrice}'")
-
-    currentPrice = float(re.sub(r'[^\d.]', '', currentPrice))  #remove any non-numeric characters
+    #get current buy price once it has actual price content
+    currentPrice = trade_panel.read_buy_price()
     #The breakoutPrice is the estimated threshold when buying momentum will increase
     # this threshold should be 2-5 % above current price, i will use 4
-    breakoutPrice = currentPrice*1.04
-
-    #create a pending order now with the new price
-    # Click to open the dropdown (it's a custom div dropdown, not a native select)
-    authenticated_page.get_by_test_id("trade-dropdown-order-type").click()
-
-    # Click the "Stop" option from the opened dropdown menu (using text only, avoiding auto-generated classes)
-    authenticated_page.get_by_text("Stop", exact=True).click()
-
-    # Fill the price input field (name attribute is "price")
-    price_input = authenticated_page.locator('input[name="price"]')
-    expect(price_input).to_be_visible()
-    price_input.fill(str(breakoutPrice))
-    
-    # Clear and fill volume field
-    volume_input = authenticated_page.get_by_test_id("trade-input-volume")
-    volume_input.click()
-    volume_input.clear()
-    volume_input.fill("0.1")
-
-    # ensure order expiry is set to Good Till Canceled
-    # Click to open the expiry dropdown (also a custom div dropdown)
-    authenticated_page.get_by_test_id("trade-dropdown-expiry").click()
-
-    # Click the "Good Till Canceled" option (note that this option is in a separate div element)
-    #the second element has to be selected.
-    authenticated_page.get_by_text("Good Till Canceled", exact=True).all()[1].click()
-    # Ensure the order button is enabled before clicking
-    order_button = authenticated_page.get_by_test_id("trade-button-order")
-    expect(order_button).to_be_enabled()
-    order_button.click()
-
-    #expect trade confirmation dialog to appear - wait longer and check for the confirm button
-    expect(authenticated_page.get_by_test_id("trade-confirmation-button-confirm")).to_be_visible(timeout=10000)
-    # Verify confirmation dialog shows the correct order type, buy stop in this case
-    expect(authenticated_page.get_by_test_id("trade-confirmation-order-type")).to_have_text("BUY STOP")
-
-    #click on confirm button
-    authenticated_page.get_by_test_id("trade-confirmation-button-confirm").click()
-    #confirm toast notification
-    expect(authenticated_page.get_by_text("Order has been created.")).to_be_visible(timeout=10000)
-
-#the Stop Buy Order with Good Till Day expiry is pending order to buy when prices reach above stated price 
-# before day ends as part of a breakout/ buying momentum 
-def test_demo_createStopGoodTillDay(authenticated_page: Page):
-    authenticated_page.goto("https://aqxtrader.aquariux.com/web/trade")
-
-    #get current buy prices - wait for element to have actual price content
-    price_element = authenticated_page.get_by_test_id("trade-live-buy-price")
-
-    # Wait for the price to actually contain numbers (not just be visible)
-    expect(price_element).to_have_text(re.compile(r'\d+'), timeout=10000)
-
-    currentPrice = price_element.text_content()
-    # Debug: print what we got
-    print(f"Raw price text: '{currentPrice}'")
-
-    currentPrice = float(re.sub(r'[^\d.]', '', currentPrice))  #remove any non-numeric characters
-    #breakoutPrice 4 % more than current price.
-    breakoutPrice = currentPrice*1.04
+    breakoutPrice = round(currentPrice*1.04, 5)
 
     #create a pending order now with the new price
-    # Click to open the dropdown (it's a custom div dropdown, not a native select)
-    authenticated_page.get_by_test_id("trade-dropdown-order-type").click()
-
-    # Click the "Limit" option from the opened dropdown menu (using text only, avoiding auto-generated classes)
-    authenticated_page.get_by_text("Stop", exact=True).click()
-
-    # Fill the price input field (name attribute is "price")
-    price_input = authenticated_page.locator('input[name="price"]')
-    expect(price_input).to_be_visible()
-    price_input.fill(str(breakoutPrice))
-    
-    # Clear and fill volume field
-    volume_input = authenticated_page.get_by_test_id("trade-input-volume")
-    volume_input.click()
-    volume_input.clear()
-    volume_input.fill("0.1")
-
-    # ensure order expiry is set to Good Till Day
-    # Click to open the expiry dropdown (also a custom div dropdown)
-    authenticated_page.get_by_test_id("trade-dropdown-expiry").click()
-
-    # Click the "Good Till Day" option, note that default is Good Til Canceled and so no need for [1]. but note in future.
-    authenticated_page.get_by_text("Good Till Day", exact=True).click()
-
-    # Ensure the order button is enabled before clicking
-    order_button = authenticated_page.get_by_test_id("trade-button-order")
-    expect(order_button).to_be_enabled()
-    order_button.click()
+    trade_panel.fill_pending_order("Stop", breakoutPrice)
 
-    #expect trade confirmation dialog to appear - wait longer and check for the confirm button
-    expect(authenticated_page.get_by_test_id("trade-confirmation-button-confirm")).to_be_visible(timeout=10000)
-    # Verify confirmation dialog shows the correct order type
-    expect(authenticated_page.get_by_test_id("trade-confirmation-order-type")).to_have_text("BUY STOP")
-
-    #click on confirm button
-    authenticated_page.get_by_test_id("trade-confirmation-button-confirm").click()
-    #confirm toast notification
-    expect(authenticated_page.get_by_text("Order has been created.")).to_be_visible(timeout=10000)
-
-#Create Stop Buy Order with Good Till Date expiry is pending order to buy 
-#when prices reach above stated price
-def test_demo_createStopGoodTillDate(authenticated_page: Page):
-    authenticated_page.goto("https://aqxtrader.aquariux.com/web/trade")
-
-    #get current buy prices - wait for element to have actual price content
-    price_element = authenticated_page.get_by_test_id("trade-live-buy-price")
-
-    # Wait for the price to actually contain numbers (not just be visible)
-    expect(price_element).to_have_text(re.compile(r'\d+'), timeout=10000)
-
-    currentPrice = price_element.text_content()
-    # Debug: print what we got
-    print(f"Raw price text: '{currentPrice}'")
-
-    currentPrice = float(re.sub(r'[^\d.]', '', currentPrice))  #remove any non-numeric characters
-    #breakoutPrice is 4 % less than current price.
-    breakoutPrice = currentPrice*1.04
-
-    #create a pending order now with the new price
-    # Click to open the dropdown (it's a custom div dropdown, not a native select)
-    authenticated_page.get_by_test_id("trade-dropdown-order-type").click()
+    # set the order expiry
+    trade_panel.select_expiry(expiry)
 
-    # Click the "Limit" option from the opened dropdown menu (using text only, avoiding auto-generated classes)
-    authenticated_page.get_by_text("Stop", exact=True).click()
+    #place the order and wait for the confirmation toast
+    trade_panel.submit_order("BUY STOP", "Order has been created.")
 
-    # Fill the price input field (name attribute is "price")
-    price_input = authenticated_page.locator('input[name="price"]')
-    expect(price_input).to_be_visible()
-    price_input.fill(str(breakoutPrice))
-    
-    # Clear and fill volume field
-    volume_input = authenticated_page.get_by_test_id("trade-input-volume")
-    volume_input.click()
-    volume_input.clear()
-    volume_input.fill("0.1")
-
-    # ensure order expiry is set to Good Till Day
-    # Click to open the expiry dropdown (also a custom div dropdown)
-    authenticated_page.get_by_test_id("trade-dropdown-expiry").click()
-
-    # Click the "Good Till Day" option, note that default is Good Til Canceled and so no need for [1]. but note in future.
-    authenticated_page.get_by_text("Specified Date", exact=True).click()
-
-    # Calculate target date (7 days from now)
-    future_date = datetime.now() + timedelta(days=7)
-    print(f"Setting expiry date to: {future_date.strftime('%Y-%m-%d')}")
-
-    # Click to open the react-calendar date picker
-    authenticated_page.get_by_test_id("trade-input-expiry-date").click()
-
-    # Wait for the calendar to appear
-    authenticated_page.wait_for_selector('.react-calendar', timeout=5000)
-
-    # Click the specific day using aria-label (format: "Month Day, Year")
-    # Example: "December 19, 2025"
-    target_aria_label = future_date.strftime("%B %d, %Y")  # "December 19, 2025"
-    print(f"Looking for calendar day with aria-label: {target_aria_label}")
-
-    # Find and click the button containing the abbr with the matching aria-label
-    # Clicking the abbr element will trigger the parent button
-    day_button = authenticated_page.locator(f'.react-calendar abbr[aria-label="{target_aria_label}"]')
-    day_button.click()
-    # Ensure the order button is enabled before clicking
-    order_button = authenticated_page.get_by_test_id("trade-button-order")
-    expect(order_button).to_be_enabled()
-    order_button.click()
-
-    #expect trade confirmation dialog to appear - wait longer and check for the confirm button
-    expect(authenticated_page.get_by_test_id("trade-confirmation-button-confirm")).to_be_visible(timeout=10000)
-    # Verify confirmation dialog shows the correct order type
-    expect(authenticated_page.get_by_test_id("trade-confirmation-order-type")).to_have_text("BUY STOP")
-
-    #click on confirm button
-    authenticated_page.get_by_test_id("trade-confirmation-button-confirm").click()
-    #confirm toast notification
-    expect(authenticated_page.get_by_text("Order has been created.")).to_be_visible(timeout=10000)
-
-#the Stop Buy Order with Good Till Date expiry is pending order to buy when prices reach below stated price 
-# until the spcified date
-def test_demo_createStopGoodTillDateAndTime(authenticated_page: Page):
-    authenticated_page.goto("https://aqxtrader.aquariux.com/web/trade")
-
-    #get current buy prices - wait for element to have actual price content
-    price_element = authenticated_page.get_by_test_id("trade-live-buy-price")
-
-    # Wait for the price to actually contain numbers (not just be visible)
-    expect(price_element).to_have_text(re.compile(r'\d+'), timeout=10000)
-
-    currentPrice = price_element.text_content()
-    # Debug: print what we got
-    print(f"Raw price text: '{currentPrice}'")
-
-    currentPrice = float(re.sub(r'[^\d.]', '', currentPrice))  #remove any non-numeric characters
-    #breakout pricemore than 4% current price.
-    breakoutPrice = currentPrice*1.04
-
-    #create a pending order now with the new price
-    # Click to open the dropdown (it's a custom div dropdown, not a native select)
-    authenticated_page.get_by_test_id("trade-dropdown-order-type").click()
-
-    # Click the "Limit" option from the opened dropdown menu (using text only, avoiding auto-generated classes)
-    authenticated_page.get_by_text("Stop", exact=True).click()
-
-    # Fill the price input field (name attribute is "price")
-    price_input = authenticated_page.locator('input[name="price"]')
-    expect(price_input).to_be_visible()
-    price_input.fill(str(breakoutPrice))
-    
-    # Clear and fill volume field
-    volume_input = authenticated_page.get_by_test_id("trade-input-volume")
-    volume_input.click()
-    volume_input.clear()
-    volume_input.fill("0.1")
-
-    # ensure order expiry is set to Good Till Day
-    # Click to open the expiry dropdown (also a custom div dropdown)
-    authenticated_page.get_by_test_id("trade-dropdown-expiry").click()
-
-    # Click the "Good Till Day" option, note that default is Good Til Canceled and so no need for [1]. but note in future.
-    authenticated_page.get_by_text("Specified Date and Time", exact=True).click()
-
-    # Calculate target date (7 days from now)
-    future_date = datetime.now() + timedelta(days=7)
-    print(f"Setting expiry date & time to: {future_date.strftime('%Y-%m-%d %H:%M')}")
-
-    # Click to open the react-calendar date picker
-    authenticated_page.get_by_test_id("trade-input-expiry-date").click()
-
-    # Wait for the calendar to appear
-    authenticated_page.wait_for_selector('.react-calendar', timeout=5000)
-
-    # Click the specific day using aria-label (format: "Month Day, Year")
-    # Example: "December 19, 2025"
-    target_aria_label = future_date.strftime("%B %d, %Y")  # "December 19, 2025"
-    print(f"Looking for calendar day with aria-label: {target_aria_label}")
-
-    # Find and click the button containing the abbr with the matching aria-label
-    # Clicking the abbr element will trigger the parent button
-    day_button = authenticated_page.locator(f'.react-calendar abbr[aria-label="{target_aria_label}"]')
-    day_button.click()
-
-    # Set the time picker
-    target_hour = future_date.strftime("%H")  # 24-hour format with leading zero, e.g., "14"
-    target_minute = future_date.strftime("%M")  # Minutes with leading zero, e.g., "05"
-
-    print(f"Setting time to: {target_hour}:{target_minute}")
-
-    # Click to open the time picker
-    authenticated_page.get_by_test_id("trade-input-expiry-time").click()
-    authenticated_page.wait_for_timeout(500)  # Wait for picker to render
-
-    # Set Hour - click the Hour dropdown
-    hour_dropdown = authenticated_page.locator('div:has-text("Hour") + div').first
-    hour_dropdown.click()
-
-    # Wait for the dropdown options to appear
-    authenticated_page.wait_for_selector('[data-testid="options"]', timeout=5000)
-
-    # Click the target hour from the dropdown
-    authenticated_page.locator(f'[data-testid="options"] div:has-text("{target_hour}")').first.click()
-
-    # Set Minute - click the Minute dropdown
-    minute_dropdown = authenticated_page.locator('div:has-text("Minute") + div').first
-    minute_dropdown.click()
-
-    # Wait for the dropdown options to appear
-    authenticated_page.wait_for_selector('[data-testid="options"]', timeout=5000)
-
-    # Click the target minute from the dropdown
-    authenticated_page.locator(f'[data-testid="options"] div:has-text("{target_minute}")').first.click()
-
-    # Click OK to confirm the time
-    authenticated_page.get_by_role("button", name="OK").click()
-
-    # Ensure the order button is enabled before clicking
-    order_button = authenticated_page.get_by_test_id("trade-button-order")
-    expect(order_button).to_be_enabled()
-    order_button.click()
-
-    #expect trade confirmation dialog to appear - wait longer and check for the confirm button
-    expect(authenticated_page.get_by_test_id("trade-confirmation-button-confirm")).to_be_visible(timeout=10000)
-    # Verify confirmation dialog shows the correct order type
-    expect(authenticated_page.get_by_test_id("trade-confirmation-order-type")).to_have_text("BUY STOP")
-
-    #click on confirm button
-    authenticated_page.get_by_test_id("trade-confirmation-button-confirm").click()
-    #confirm toast notification
-    expect(authenticated_page.get_by_text("Order has been created.")).to_be_visible(timeout=10000)
-
-def test_demo_editPendingOrder(authenticated_page: Page):
+def test_demo_editPendingOrder(authenticated_page: Page, trade_panel: TradePanel):
     #Go to Assets page
     authenticated_page.goto("https://aqxtrader.aquariux.com/web/assets")
     #click on Assets tab to see all orders
     #authenticated_page.get_by_test_id("side-bar-option-assets").click()
 
     #make sure both pending and open orders are present
-    expect(authenticated_page.get_by_test_id("tab-asset-order-type-open-positions")).to_be_visible()
-    expect(authenticated_page.get_by_test_id("tab-asset-order-type-pending-orders")).to_be_visible()
+    pendingOrdersTab = authenticated_page.get_by_test_id("tab-asset-order-type-pending-orders")
+    authenticated_page.get_by_test_id("tab-asset-order-type-open-positions").wait_for(state="visible", timeout=5000)
+    pendingOrdersTab.wait_for(state="visible", timeout=5000)
 
     #click on Pending orders tab
-    authenticated_page.get_by_test_id("tab-asset-order-type-pending-orders").click()
+    pendingOrdersTab.click()
     
     #retrieve the latest pending position
     latestRow = authenticated_page.get_by_test_id("asset-pending-list-item").last
     latestRow.get_by_test_id("asset-open-button-edit").click()
 
     #locate the overlay dialog
-    overlay = authenticated_page.locator('div[id="overlay-aqx-trader"]').all()[0]
+    overlay = authenticated_page.locator('div[id="overlay-aqx-trader"]').first
+    editConfirmButton = overlay.get_by_role("button", name="Confirm")
 
-    #expect trade confirmation dialog to appear - wait longer and check for the confirm button
-    expect(authenticated_page.get_by_text("Edit Order")).to_be_visible(timeout=10000)
-    expect(overlay.locator('button:has-text("Confirm")')).to_be_visible(timeout=10000)
+    #expect Edit Order dialog to appear - its confirm button renders with it, so one wait covers both
+    editConfirmButton.wait_for(state="visible", timeout=10000)
     
-    # retrieve the orderPrice
-    orderPrice = authenticated_page.locator('input[name="price"]').input_value()
+    # retrieve the orderPrice once the dialog has filled it in
+    expect(trade_panel.price).to_have_value(NUMERIC_VALUE_RE)
+    orderPrice = trade_panel.price.input_value()
     #for Debug purposes
     print(f"Current Order Price: {orderPrice}")
 
-    orderLimitTypeList = overlay.locator('div').filter(has_text=re.compile(r"^BUY LIMIT$")).all()
-    for element in orderLimitTypeList:
-        print(f"BUY LIMIT elements found: {element.text_content()}")
-    orderStopTypeList = overlay.locator('div').filter(has_text=re.compile(r"^BUY STOP$")).all()
-    for element in orderStopTypeList:
-        print(f"BUY STOP elements found: {element.text_content()}")
-
     # check if the order being edited is STOP or LIMIT
     #modify the orderPrice prices by 1 % up or down based on type of order
-    if overlay.locator('div').filter(has_text=re.compile(r"^BUY LIMIT$")).all()[0].is_visible():
+    #check the first match only, instead of materialising every match with all() first
+    if overlay.locator('div').filter(has_text=BUY_LIMIT_RE).first.is_visible():
         # LIMIT order - reduce price by 0.5 % as limit order buys when stock price below stated price
         newOrderPrice = round(float(orderPrice)*0.995, 5)
         orderType = "BUY LIMIT"
-    elif overlay.locator('div').filter(has_text=re.compile(r"^BUY STOP$")).all()[0].is_visible():
+    elif overlay.locator('div').filter(has_text=BUY_STOP_RE).first.is_visible():
         # STOP order - increase price by 1 % as stop order buys when stock price above stated price
         newOrderPrice = round(float(orderPrice)*1.005, 5)
         orderType = "BUY STOP"
+    else:
+        raise AssertionError("Order type not recognized, the edited order is neither BUY LIMIT nor BUY STOP.")
     
     print(f"New Order Price: {newOrderPrice}")
     #prepare the price inputs as 5 % more and less than current price
@@ -944,143 +561,52 @@ def test_demo_editPendingOrder(authenticated_page: Page):
 
     # new stoploss and takeprofit prices for verification later
     #note that the price input has to be first before the other 2 prices
-    authenticated_page.locator('input[name="price"]').fill(str(newOrderPrice))
-    authenticated_page.get_by_test_id("trade-input-stoploss-price").fill(str(stopLossPrice))
-    authenticated_page.get_by_test_id("trade-input-takeprofit-price").fill(str(takeProfitPrice))
+    trade_panel.price.fill(str(newOrderPrice))
+    trade_panel.stop_loss_price.fill(str(stopLossPrice))
+    trade_panel.take_profit_price.fill(str(takeProfitPrice))
+    #the points fields auto-update when the price input loses focus, blur it directly instead of clicking another field
+    trade_panel.take_profit_price.blur()
     
 
     #prepare future datetime in case of expiry change
     future_date = datetime.now() + timedelta(days=7)
-    oldExpiryType: str = ""
-    newExpiryType: str = ""
-    #new Expiry Change
-    expiryType = authenticated_page.get_by_test_id("trade-dropdown-expiry")
-    if expiryType.get_by_text("Good Till Canceled").is_visible():
-        oldExpiryType = "Good Till Canceled"
-        newExpiryType = "Good Till Day"
-        #change to Good Till Day
-        expiryType.click()
-        overlay.get_by_text("Good Till Day", exact=True).click()
-        expect(overlay.get_by_test_id("trade-dropdown-expiry")).to_have_text(newExpiryType)
-    elif expiryType.get_by_text("Good Till Day").is_visible():
-        oldExpiryType = "Good Till Day"
-        newExpiryType = "Specified Date"
-        #change to Specified Date
-        expiryType.click()
-        overlay.get_by_text("Specified Date", exact=True).click()
-        # Calculate target date (7 days from now)
-        print(f"Setting expiry date to: {future_date.strftime('%Y-%m-%d')}")
-
-        # Click to open the react-calendar date picker
-        authenticated_page.get_by_test_id("trade-input-expiry-date").click()
-
-        # Wait for the calendar to appear
-        authenticated_page.wait_for_selector('.react-calendar', timeout=5000)
-
-        # Click the specific day using aria-label (format: "Month Day, Year")
-        # Example: "December 19, 2025"
-        target_aria_label = future_date.strftime("%B %d, %Y")  # "December 19, 2025"
-        print(f"Looking for calendar day with aria-label: {target_aria_label}")
-
-        # Find and click the button containing the abbr with the matching aria-label
-        # Clicking the abbr element will trigger the parent button
-        day_button = authenticated_page.locator(f'.react-calendar abbr[aria-label="{target_aria_label}"]')
-        day_button.click()
-        expect(overlay.get_by_test_id("trade-dropdown-expiry")).to_have_text(newExpiryType)
-    elif expiryType.get_by_text("Specified Date").is_visible():
-        oldExpiryType = "Specified Date"
-        newExpiryType = "Specified Date and Time"
-        #change to Specified Date and Time
-        expiryType.click()
-        overlay.get_by_text("Specified Date and Time", exact=True).click()
-        # Calculate target date (7 days from now)
-        print(f"Setting expiry date & time to: {future_date.strftime('%Y-%m-%d %H:%M')}")
-
-        # Click to open the react-calendar date picker
-        authenticated_page.get_by_test_id("trade-input-expiry-date").click()
-
-        # Wait for the calendar to appear
-        authenticated_page.wait_for_selector('.react-calendar', timeout=5000)
-
-        # Click the specific day using aria-label (format: "Month Day, Year")
-        # Example: "December 19, 2025"
-        target_aria_label = future_date.strftime("%B %d, %Y")  # "December 19, 2025"
-        print(f"Looking for calendar day with aria-label: {target_aria_label}")
-
-        # Find and click the button containing the abbr with the matching aria-label
-        # Clicking the abbr element will trigger the parent button
-        day_button = authenticated_page.locator(f'.react-calendar abbr[aria-label="{target_aria_label}"]')
-        day_button.click()
-
-        # Set the time picker
-        target_hour = future_date.strftime("%H")  # 24-hour format with leading zero, e.g., "14"
-        target_minute = future_date.strftime("%M")  # Minutes with leading zero, e.g., "05"
-
-        print(f"Setting time to: {target_hour}:{target_minute}")
-
-        # Click to open the time picker
-        authenticated_page.get_by_test_id("trade-input-expiry-time").click()
-        authenticated_page.wait_for_timeout(500)  # Wait for picker to render
-
-        # Set Hour - click the Hour dropdown
-        hour_dropdown = authenticated_page.locator('div:has-text("Hour") + div').first
-        hour_dropdown.click()
-
-        # Wait for the dropdown options to appear
-        authenticated_page.wait_for_selector('[data-testid="options"]', timeout=5000)
-
-        # Click the target hour from the dropdown
-        authenticated_page.locator(f'[data-testid="options"] div:has-text("{target_hour}")').first.click()
-
-        # Set Minute - click the Minute dropdown
-        minute_dropdown = authenticated_page.locator('div:has-text("Minute") + div').first
-        minute_dropdown.click()
-        expect(overlay.get_by_test_id("trade-dropdown-expiry")).to_have_text(newExpiryType)
-    elif expiryType.get_by_text("Specified Date and Time").is_visible():
-        oldExpiryType = "Specified Date and Time"
-        newExpiryType = "Good Till Canceled"
-        #change to Good Till Canceled
-        expiryType.click()
-        overlay.get_by_text("Good Till Canceled", exact=True).click()
-        expect(overlay.get_by_test_id("trade-dropdown-expiry")).to_have_text(newExpiryType)
-    else:
-        print("Expiry type not recognized, no changes made.")
-        raise AssertionError("Expiry type not recognized, no changes made.")
+    #each edit moves the order on to the next type of expiry
+    nextExpiryTypes = {
+        "Good Till Canceled": "Good Till Day",
+        "Good Till Day": "Specified Date",
+        "Specified Date": "Specified Date and Time",
+        "Specified Date and Time": "Good Till Canceled",
+    }
+    #new Expiry Change - read the current expiry once instead of probing each type with is_visible()
+    expiryType = trade_panel.expiry_dropdown
+    oldExpiryType = expiryType.text_content().strip()
+    if oldExpiryType not in nextExpiryTypes:
+        raise AssertionError(f"Expiry type {oldExpiryType} not recognized, no changes made.")
+    newExpiryType = nextExpiryTypes[oldExpiryType]
+    expiryType.click()
+    overlay.get_by_text(newExpiryType, exact=True).click()
+    if newExpiryType.startswith("Specified Date"):
+        trade_panel.pick_expiry_date(future_date)
+    if newExpiryType == "Specified Date and Time":
+        trade_panel.pick_expiry_time(future_date)
+    expect(expiryType).to_have_text(newExpiryType)
 
     #Debug
     print(f"Old Expiry Type: {oldExpiryType}, New Expiry Type: {newExpiryType}")
-    #click on separate field to activate auto-update
-    authenticated_page.get_by_test_id("trade-input-takeprofit-points").click()
-
 
     # click on Confirm position button
-    overlay.get_by_role("button").filter(has_text="Confirm").click()
-
-    #expect order confirmation dialog to appear
-    expect(overlay.get_by_text("Order Confirmation")).to_be_visible(timeout=10000)
-    expect(overlay.get_by_test_id("trade-confirmation-button-confirm")).to_be_visible(timeout=10000)
+    editConfirmButton.click()
 
-    #Verify correct order type
-    expect(authenticated_page.get_by_test_id("trade-confirmation-order-type")).to_have_text(orderType)
-    #verify expiry type change
-    #Debug
-    confirmationValuesList = authenticated_page.locator('div[data-testid="trade-confirmation-value"]').all()
+    #expect order confirmation dialog with the correct order type - to_have_text waits for the dialog to appear
+    expect(trade_panel.confirmation_order_type).to_have_text(orderType, timeout=10000)
+    confirmationValues = authenticated_page.get_by_test_id("trade-confirmation-value")
     # 0 is volume, 1 is units, 2 is price, 3 is stop loss, 4 is take profit, 5 is expiry, 6 is expirydate, 7 is Fill Policy
-    expiryConfirmationValue = confirmationValuesList[5]
-    print(f"Expiry Confirmation Value: {expiryConfirmationValue.text_content()}")
-    expect(expiryConfirmationValue).to_have_text(newExpiryType)
-    # verify the stopLoss and takeprofit price changes
-    # Target the parent div that contains both label and value, then get the value sibling
-    # basically 1 parent -> 1st div(label):text with stop loss, 2nd div(value):text
-    stop_loss_value = confirmationValuesList[3]
-    take_profit_value = confirmationValuesList[4]
-
-    # Wait for elements to be visible
-    expect(stop_loss_value).to_be_visible()
-    expect(take_profit_value).to_be_visible()
-
-    tradeStopLossPrice = stop_loss_value.text_content()
-    tradeTakeProfitPrice = take_profit_value.text_content()
+    #verify expiry type change - to_have_text also waits for the values to render
+    expect(confirmationValues.nth(5)).to_have_text(newExpiryType)
+    # verify the stopLoss and takeprofit price changes, reading every value in one call
+    confirmationValuesText = confirmationValues.all_text_contents()
+    tradeStopLossPrice = confirmationValuesText[3]
+    tradeTakeProfitPrice = confirmationValuesText[4]
 
     print(f"Trade Stop Loss: {tradeStopLossPrice}, Trade Take Profit: {tradeTakeProfitPrice}")
     if float(tradeStopLossPrice) != stopLossPrice:
@@ -1089,39 +615,27 @@ def test_demo_editPendingOrder(authenticated_page: Page):
         raise AssertionError(f"Take Profit price mismatch: expected {takeProfitPrice}, got {tradeTakeProfitPrice}")
     
     #click confirm button
-    authenticated_page.get_by_test_id("trade-confirmation-button-confirm").click()
+    trade_panel.confirm_button.click()
 
     #expect toast notification
     expect(authenticated_page.get_by_text("Order has been updated.")).to_be_visible()
 
-def test_demo_validateOrderHistory(authenticated_page: Page):
+def test_demo_validateOrderHistory(authenticated_page: Page, trade_panel: TradePanel):
     # go to trade page
     authenticated_page.goto("https://aqxtrader.aquariux.com/web/trade")
-    #get current buy prices - wait for element to have actual price content
-    price_element = authenticated_page.get_by_test_id("trade-live-buy-price")
-
-    # Wait for the price to actually contain numbers (not just be visible)
-    expect(price_element).to_have_text(re.compile(r'\d+'), timeout=10000)
-
-    currentPrice = price_element.text_content()
-    # Debug: print what we got
-    print(f"Raw price text: '{currentPrice}'")
-
-    currentPrice = float(re.sub(r'[^\d.]', '', currentPrice))  #remove any non-numeric characters
+    #get current buy price once it has actual price content
+    currentPrice = trade_panel.read_buy_price()
     #prepare the price inputs as 5 % more and less than current price
-    stopLossPrice = currentPrice*0.95
-    takeProfitPrice = currentPrice*1.05
-    authenticated_page.get_by_test_id("trade-input-stoploss-price").fill(str(stopLossPrice))
-    authenticated_page.get_by_test_id("trade-input-takeprofit-price").fill(str(takeProfitPrice))
+    stopLossPrice = round(currentPrice*0.95, 5)
+    takeProfitPrice = round(currentPrice*1.05, 5)
+    trade_panel.stop_loss_price.fill(str(stopLossPrice))
+    trade_panel.take_profit_price.fill(str(takeProfitPrice))
 
-    #need to click on 2 different fields for the take profit points and volume points to auto-fill
-    authenticated_page.get_by_test_id("trade-input-takeprofit-points").click()
+    #the points fields auto-fill when the price inputs lose focus, blur directly instead of clicking another field
+    trade_panel.take_profit_price.blur()
 
-    # Clear and fill volume field
-    volume_input = authenticated_page.get_by_test_id("trade-input-volume")
-    volume_input.click()
-    volume_input.clear()
-    volume_input.fill("0.1")
+    # fill volume field - fill() focuses and replaces the existing value, no separate click/clear needed
+    trade_panel.volume.fill("0.1")
 
     # add voume by 30 as min
     #page.get_by_test_id("trade-input-stoploss-points").fill("30")
@@ -1129,46 +643,33 @@ def test_demo_validateOrderHistory(authenticated_page: Page):
 
     #get server time for order time verification later
     # retrieve server time e.g. Server Time : 2025-12-12 16:53:20
-    server_time_str = authenticated_page.locator("div").filter(has_text=re.compile(r"^Server Time : ")).first.text_content()
+    #get_by_text resolves to the element that holds the text itself, instead of filtering every div on the page
+    server_time_str = authenticated_page.get_by_text(SERVER_TIME_RE).first.text_content()
     serverTime = server_time_str.replace("Server Time : ", "").strip()
     #convert to datetime
-    serverTime_dt = datetime.strptime(serverTime, "%Y-%m-%d %H:%M:%S")
-
-    # Ensure the order button is enabled before clicking
-    order_button = authenticated_page.get_by_test_id("trade-button-order")
-    expect(order_button).to_be_enabled()
-    order_button.click()
-
-    #expect trade confirmation dialog to appear - wait longer and check for the confirm button
-    expect(authenticated_page.get_by_test_id("trade-confirmation-button-confirm")).to_be_visible(timeout=10000)
-
-    # Verify confirmation dialog shows the correct order type
-    expect(authenticated_page.get_by_test_id("trade-confirmation-order-type")).to_have_text("BUY")
+    serverTime_dt = datetime.strptime(serverTime, SERVER_TIME_FORMAT)
 
     print(f"Server Time: {serverTime_dt}")
-    # place a market order
-    authenticated_page.get_by_test_id("trade-confirmation-button-confirm").click()
 
-    expect(authenticated_page.get_by_text("Position has been created")).to_be_visible()
+    # place a market order
+    trade_panel.submit_order("BUY", "Position has been created")
 
     #click on Assets tab to see all orders
     authenticated_page.get_by_test_id("side-bar-option-assets").click()
     #click on Postition History tab to go to order history
     authenticated_page.get_by_test_id("tab-asset-order-type-history").click()
-    authenticated_page.get_by_test_id("tab-asset-order-type-history-orders-and-deals").click()
+    #the sub tab renders after the history tab is opened, wait for it explicitly with a short ceiling
+    ordersAndDealsTab = authenticated_page.get_by_test_id("tab-asset-order-type-history-orders-and-deals")
+    ordersAndDealsTab.wait_for(state="visible", timeout=5000)
+    ordersAndDealsTab.click()
     
-    smallest_time_diff = timedelta.max
-    correctRow = None
-    #wait for 2 seconds to ensure data loaded
-    authenticated_page.wait_for_timeout(2000)
-    #retrieve the latest pending position
-    latestRow = authenticated_page.get_by_test_id("asset-history-position-list-item").all()
-    for row in latestRow:
-        row_dt_str = row.get_by_test_id("asset-history-column-open-date").text_content()
-        row_dt = datetime.strptime(row_dt_str, "%Y-%m-%d %H:%M:%S")
-        time_diff = abs(serverTime_dt - row_dt)
-        if time_diff < smallest_time_diff:
-            smallest_time_diff = time_diff
-            correctRow = row
+    historyRows = authenticated_page.get_by_test_id("asset-history-position-list-item")
+    #wait for the history list to render instead of a fixed 2 second sleep
+    historyRows.first.wait_for(state="attached", timeout=5000)
+    #read all open dates in one call, then pick the row closest to the server time
+    rowDates = [datetime.strptime(row_dt_str, SERVER_TIME_FORMAT)
+                for row_dt_str in historyRows.get_by_test_id("asset-history-column-open-date").all_text_contents()]
+    closestIdx = min(range(len(rowDates)), key=lambda i: abs(serverTime_dt - rowDates[i]))
+    correctRow = historyRows.nth(closestIdx)
     orderNo = correctRow.get_by_test_id("asset-history-column-order-id").text_content()
     correctRow.get_by_test_id("asset-history-position-list-item-expand").click()
\ No newline at end of file